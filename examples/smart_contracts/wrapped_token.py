@@ -12,12 +12,13 @@ def all_tokens_unlocked_from_contract_address(
     txins: List[TxInInfo], address: Address, token: Token
 ) -> int:
     # generally always iterate over all inputs to avoid double spending
+    policy_id = token.policy_id
+    token_name = token.token_name
+    no_tokens: Dict[TokenName, int] = {}
     res = 0
     for txi in txins:
         if txi.resolved.address == address:
-            res += txi.resolved.value.get(token.policy_id, {b"": 0}).get(
-                token.token_name, 0
-            )
+            res += txi.resolved.value.get(policy_id, no_tokens).get(token_name, 0)
     return res
 
 
@@ -46,10 +47,13 @@ def own_address(own_policy_id: PolicyId) -> Address:
 def all_tokens_locked_at_contract_address(
     txouts: List[TxOut], address: Address, token: Token
 ) -> int:
+    policy_id = token.policy_id
+    token_name = token.token_name
+    no_tokens: Dict[TokenName, int] = {}
     res = 0
     for txo in txouts:
         if txo.address == address:
-            res += txo.value.get(token.policy_id, {b"": 0}).get(token.token_name, 0)
+            res += txo.value.get(policy_id, no_tokens).get(token_name, 0)
             # enforce a small inlined datum
             assert txo.datum == SomeOutputDatum(
                 b""
@@ -1,7 +1,14 @@
-from enum import Enum
+from enum import Enum, auto
+from functools import lru_cache
 
 from .typed_ast import *
 
+# frequently used nodes, shared by the implementations below instead of being created anew each time
+_VAR_X = OVar("x")
+_VAR_XS = OVar("xs")
+_INT_0 = plt.Integer(0)
+_INT_1 = plt.Integer(1)
+
 
 class LenImpl(PolymorphicFunction):
     def type_from_args(self, args: typing.List[Type]) -> FunctionType:
@@ -17,25 +24,40 @@ class LenImpl(PolymorphicFunction):
         arg = args[0]
         assert isinstance(arg, InstanceType), "Can only determine length of instances"
         if arg == ByteStringInstanceType:
-            return OLambda(["x"], plt.LengthOfByteString(OVar("x")))
+            return len_impl("bytes")
         elif isinstance(arg.typ, ListType) or isinstance(arg.typ, DictType):
-            # simple list length function
-            return OLambda(
-                ["x"],
-                plt.FoldList(
-                    OVar("x"),
-                    OLambda(["a", "_"], plt.AddInteger(OVar("a"), plt.Integer(1))),
-                    plt.Integer(0),
-                ),
-            )
+            return len_impl("list")
         elif isinstance(arg.typ, TupleType):
-            return OLambda(
-                ["x"],
-                plt.Integer(len(arg.typ.typs)),
-            )
+            return len_impl("tuple", len(arg.typ.typs))
         raise NotImplementedError(f"'len' is not implemented for type {arg}")
 
 
+@lru_cache(maxsize=None)
+def len_impl(kind: str, tuple_length: int = 0) -> plt.AST:
+    """
+    Builds the implementation of len for the kind of argument only once.
+    The element type of lists and dicts does not matter for their length.
+    """
+    if kind == "bytes":
+        return OLambda(["x"], plt.LengthOfByteString(_VAR_X))
+    elif kind == "list":
+        # simple list length function
+        return OLambda(
+            ["x"],
+            plt.FoldList(
+                _VAR_X,
+                OLambda(["a", "_"], plt.AddInteger(OVar("a"), _INT_1)),
+                _INT_0,
+            ),
+        )
+    elif kind == "tuple":
+        return OLambda(
+            ["x"],
+            plt.Integer(tuple_length),
+        )
+    raise NotImplementedError(f"'len' is not implemented for {kind}")
+
+
 class ReversedImpl(PolymorphicFunction):
     def type_from_args(self, args: typing.List[Type]) -> FunctionType:
         assert (
@@ -55,8 +77,8 @@ class ReversedImpl(PolymorphicFunction):
             return OLambda(
                 ["xs"],
                 plt.FoldList(
-                    OVar("xs"),
-                    OLambda(["a", "x"], plt.MkCons(OVar("x"), OVar("a"))),
+                    _VAR_XS,
+                    OLambda(["a", "x"], plt.MkCons(_VAR_X, OVar("a"))),
                     empty_l,
                 ),
             )
@@ -105,7 +127,7 @@ class IsinstanceImpl(PolymorphicFunction):
             return OLambda(
                 ["x"],
                 plt.ChooseData(
-                    OVar("x"),
+                    _VAR_X,
                     plt.Bool(False),
                     plt.Bool(False),
                     plt.Bool(False),
@@ -117,7 +139,7 @@ class IsinstanceImpl(PolymorphicFunction):
             return OLambda(
                 ["x"],
                 plt.ChooseData(
-                    OVar("x"),
+                    _VAR_X,
                     plt.Bool(False),
                     plt.Bool(False),
                     plt.Bool(False),
@@ -129,7 +151,7 @@ class IsinstanceImpl(PolymorphicFunction):
             return OLambda(
                 ["x"],
                 plt.ChooseData(
-                    OVar("x"),
+                    _VAR_X,
                     plt.Bool(True),
                     plt.Bool(False),
                     plt.Bool(False),
@@ -141,7 +163,7 @@ class IsinstanceImpl(PolymorphicFunction):
             return OLambda(
                 ["x"],
                 plt.ChooseData(
-                    OVar("x"),
+                    _VAR_X,
                     plt.Bool(False),
                     plt.Bool(False),
                     plt.Bool(True),
@@ -153,7 +175,7 @@ class IsinstanceImpl(PolymorphicFunction):
             return OLambda(
                 ["x"],
                 plt.ChooseData(
-                    OVar("x"),
+                    _VAR_X,
                     plt.Bool(False),
                     plt.Bool(True),
                     plt.Bool(False),
@@ -168,73 +190,97 @@ class IsinstanceImpl(PolymorphicFunction):
 
 
 class PythonBuiltIn(Enum):
-    all = OLambda(
+    all = auto()
+    any = auto()
+    abs = auto()
+    chr = auto()
+    breakpoint = auto()
+    hex = auto()
+    len = auto()
+    max = auto()
+    min = auto()
+    print = auto()
+    pow = auto()
+    oct = auto()
+    range = auto()
+    reversed = auto()
+    sum = auto()
+    isinstance = auto()
+
+    def impl(self) -> plt.AST:
+        """Returns the implementation of the (non-polymorphic) builtin, built on first use"""
+        return _python_builtin_impl(self)
+
+
+# builders for the implementations of the non-polymorphic builtins
+PythonBuiltInImpls = {
+    PythonBuiltIn.all: lambda: OLambda(
         ["xs"],
         plt.FoldList(
-            OVar("xs"),
-            OLambda(["x", "a"], plt.And(OVar("x"), OVar("a"))),
+            _VAR_XS,
+            OLambda(["x", "a"], plt.And(_VAR_X, OVar("a"))),
             plt.Bool(True),
         ),
-    )
-    any = OLambda(
+    ),
+    PythonBuiltIn.any: lambda: OLambda(
         ["xs"],
         plt.FoldList(
-            OVar("xs"),
-            OLambda(["x", "a"], plt.Or(OVar("x"), OVar("a"))),
+            _VAR_XS,
+            OLambda(["x", "a"], plt.Or(_VAR_X, OVar("a"))),
             plt.Bool(False),
         ),
-    )
-    abs = OLambda(
+    ),
+    PythonBuiltIn.abs: lambda: OLambda(
         ["x"],
         plt.Ite(
-            plt.LessThanInteger(OVar("x"), plt.Integer(0)),
-            plt.Negate(OVar("x")),
-            OVar("x"),
+            plt.LessThanInteger(_VAR_X, _INT_0),
+            plt.Negate(_VAR_X),
+            _VAR_X,
         ),
-    )
+    ),
     # maps an integer to a unicode code point and decodes it
     # reference: https://en.wikipedia.org/wiki/UTF-8#Encoding
-    chr = OLambda(
+    PythonBuiltIn.chr: lambda: OLambda(
         ["x"],
         plt.DecodeUtf8(
             plt.Ite(
-                plt.LessThanInteger(OVar("x"), plt.Integer(0x0)),
+                plt.LessThanInteger(_VAR_X, plt.Integer(0x0)),
                 plt.TraceError("ValueError: chr() arg not in range(0x110000)"),
                 plt.Ite(
-                    plt.LessThanInteger(OVar("x"), plt.Integer(0x80)),
+                    plt.LessThanInteger(_VAR_X, plt.Integer(0x80)),
                     # encoding of 0x0 - 0x80
-                    plt.ConsByteString(OVar("x"), plt.ByteString(b"")),
+                    plt.ConsByteString(_VAR_X, plt.ByteString(b"")),
                     plt.Ite(
-                        plt.LessThanInteger(OVar("x"), plt.Integer(0x800)),
+                        plt.LessThanInteger(_VAR_X, plt.Integer(0x800)),
                         # encoding of 0x80 - 0x800
                         plt.ConsByteString(
                             # we do bit manipulation using integer arithmetic here - nice
                             plt.AddInteger(
                                 plt.Integer(0b110 << 5),
-                                plt.DivideInteger(OVar("x"), plt.Integer(1 << 6)),
+                                plt.DivideInteger(_VAR_X, plt.Integer(1 << 6)),
                             ),
                             plt.ConsByteString(
                                 plt.AddInteger(
                                     plt.Integer(0b10 << 6),
-                                    plt.ModInteger(OVar("x"), plt.Integer(1 << 6)),
+                                    plt.ModInteger(_VAR_X, plt.Integer(1 << 6)),
                                 ),
                                 plt.ByteString(b""),
                             ),
                         ),
                         plt.Ite(
-                            plt.LessThanInteger(OVar("x"), plt.Integer(0x10000)),
+                            plt.LessThanInteger(_VAR_X, plt.Integer(0x10000)),
                             # encoding of 0x800 - 0x10000
                             plt.ConsByteString(
                                 plt.AddInteger(
                                     plt.Integer(0b1110 << 4),
-                                    plt.DivideInteger(OVar("x"), plt.Integer(1 << 12)),
+                                    plt.DivideInteger(_VAR_X, plt.Integer(1 << 12)),
                                 ),
                                 plt.ConsByteString(
                                     plt.AddInteger(
                                         plt.Integer(0b10 << 6),
                                         plt.DivideInteger(
                                             plt.ModInteger(
-                                                OVar("x"), plt.Integer(1 << 12)
+                                                _VAR_X, plt.Integer(1 << 12)
                                             ),
                                             plt.Integer(1 << 6),
                                         ),
@@ -242,30 +288,26 @@ class PythonBuiltIn(Enum):
                                     plt.ConsByteString(
                                         plt.AddInteger(
                                             plt.Integer(0b10 << 6),
-                                            plt.ModInteger(
-                                                OVar("x"), plt.Integer(1 << 6)
-                                            ),
+                                            plt.ModInteger(_VAR_X, plt.Integer(1 << 6)),
                                         ),
                                         plt.ByteString(b""),
                                     ),
                                 ),
                             ),
                             plt.Ite(
-                                plt.LessThanInteger(OVar("x"), plt.Integer(0x110000)),
+                                plt.LessThanInteger(_VAR_X, plt.Integer(0x110000)),
                                 # encoding of 0x10000 - 0x10FFF
                                 plt.ConsByteString(
                                     plt.AddInteger(
                                         plt.Integer(0b11110 << 3),
-                                        plt.DivideInteger(
-                                            OVar("x"), plt.Integer(1 << 18)
-                                        ),
+                                        plt.DivideInteger(_VAR_X, plt.Integer(1 << 18)),
                                     ),
                                     plt.ConsByteString(
                                         plt.AddInteger(
                                             plt.Integer(0b10 << 6),
                                             plt.DivideInteger(
                                                 plt.ModInteger(
-                                                    OVar("x"), plt.Integer(1 << 18)
+                                                    _VAR_X, plt.Integer(1 << 18)
                                                 ),
                                                 plt.Integer(1 << 12),
                                             ),
@@ -275,7 +317,7 @@ class PythonBuiltIn(Enum):
                                                 plt.Integer(0b10 << 6),
                                                 plt.DivideInteger(
                                                     plt.ModInteger(
-                                                        OVar("x"),
+                                                        _VAR_X,
                                                         plt.Integer(1 << 12),
                                                     ),
                                                     plt.Integer(1 << 6),
@@ -285,7 +327,7 @@ class PythonBuiltIn(Enum):
                                                 plt.AddInteger(
                                                     plt.Integer(0b10 << 6),
                                                     plt.ModInteger(
-                                                        OVar("x"),
+                                                        _VAR_X,
                                                         plt.Integer(1 << 6),
                                                     ),
                                                 ),
@@ -303,9 +345,9 @@ class PythonBuiltIn(Enum):
                 ),
             )
         ),
-    )
-    breakpoint = OLambda(["_"], plt.NoneData())
-    hex = OLambda(
+    ),
+    PythonBuiltIn.breakpoint: lambda: OLambda(["_"], plt.NoneData()),
+    PythonBuiltIn.hex: lambda: OLambda(
         ["x"],
         plt.DecodeUtf8(
             OLet(
@@ -316,9 +358,7 @@ class PythonBuiltIn(Enum):
                             OLambda(
                                 ["f", "i"],
                                 plt.Ite(
-                                    plt.LessThanEqualsInteger(
-                                        OVar("i"), plt.Integer(0)
-                                    ),
+                                    plt.LessThanEqualsInteger(OVar("i"), _INT_0),
                                     plt.EmptyIntegerList(),
                                     plt.MkCons(
                                         OLet(
@@ -369,76 +409,74 @@ class PythonBuiltIn(Enum):
                     ),
                 ],
                 plt.Ite(
-                    plt.EqualsInteger(OVar("x"), plt.Integer(0)),
+                    plt.EqualsInteger(_VAR_X, _INT_0),
                     plt.ByteString(b"0x0"),
                     plt.Ite(
-                        plt.LessThanInteger(OVar("x"), plt.Integer(0)),
+                        plt.LessThanInteger(_VAR_X, _INT_0),
                         plt.ConsByteString(
                             plt.Integer(ord("-")),
                             plt.AppendByteString(
                                 plt.ByteString(b"0x"),
-                                plt.Apply(OVar("mkstr"), plt.Negate(OVar("x"))),
+                                plt.Apply(OVar("mkstr"), plt.Negate(_VAR_X)),
                             ),
                         ),
                         plt.AppendByteString(
                             plt.ByteString(b"0x"),
-                            plt.Apply(OVar("mkstr"), OVar("x")),
+                            plt.Apply(OVar("mkstr"), _VAR_X),
                         ),
                     ),
                 ),
             )
         ),
-    )
-    len = "len"
-    max = OLambda(
+    ),
+    PythonBuiltIn.max: lambda: OLambda(
         ["xs"],
         plt.IteNullList(
-            OVar("xs"),
+            _VAR_XS,
             plt.TraceError("ValueError: max() arg is an empty sequence"),
             plt.FoldList(
-                plt.TailList(OVar("xs")),
+                plt.TailList(_VAR_XS),
                 OLambda(
                     ["x", "a"],
                     plt.IfThenElse(
-                        plt.LessThanInteger(OVar("a"), OVar("x")),
-                        OVar("x"),
+                        plt.LessThanInteger(OVar("a"), _VAR_X),
+                        _VAR_X,
                         OVar("a"),
                     ),
                 ),
-                plt.HeadList(OVar("xs")),
+                plt.HeadList(_VAR_XS),
             ),
         ),
-    )
-    min = OLambda(
+    ),
+    PythonBuiltIn.min: lambda: OLambda(
         ["xs"],
         plt.IteNullList(
-            OVar("xs"),
+            _VAR_XS,
             plt.TraceError("ValueError: min() arg is an empty sequence"),
             plt.FoldList(
-                plt.TailList(OVar("xs")),
+                plt.TailList(_VAR_XS),
                 OLambda(
                     ["x", "a"],
                     plt.IfThenElse(
-                        plt.LessThanInteger(OVar("a"), OVar("x")),
+                        plt.LessThanInteger(OVar("a"), _VAR_X),
                         OVar("a"),
-                        OVar("x"),
+                        _VAR_X,
                     ),
                 ),
-                plt.HeadList(OVar("xs")),
+                plt.HeadList(_VAR_XS),
             ),
         ),
-    )
-    print = "print"
+    ),
     # NOTE: only correctly defined for positive y
-    pow = OLambda(
+    PythonBuiltIn.pow: lambda: OLambda(
         ["x", "y"],
         plt.Ite(
-            plt.LessThanInteger(OVar("y"), plt.Integer(0)),
+            plt.LessThanInteger(OVar("y"), _INT_0),
             plt.TraceError("Negative exponentiation is not supported"),
-            PowImpl(OVar("x"), OVar("y")),
+            PowImpl(_VAR_X, OVar("y")),
         ),
-    )
-    oct = OLambda(
+    ),
+    PythonBuiltIn.oct: lambda: OLambda(
         ["x"],
         plt.DecodeUtf8(
             OLet(
@@ -449,9 +487,7 @@ class PythonBuiltIn(Enum):
                             OLambda(
                                 ["f", "i"],
                                 plt.Ite(
-                                    plt.LessThanEqualsInteger(
-                                        OVar("i"), plt.Integer(0)
-                                    ),
+                                    plt.LessThanEqualsInteger(OVar("i"), _INT_0),
                                     plt.EmptyIntegerList(),
                                     plt.MkCons(
                                         plt.AddInteger(
@@ -486,38 +522,40 @@ class PythonBuiltIn(Enum):
                     ),
                 ],
                 plt.Ite(
-                    plt.EqualsInteger(OVar("x"), plt.Integer(0)),
+                    plt.EqualsInteger(_VAR_X, _INT_0),
                     plt.ByteString(b"0o0"),
                     plt.Ite(
-                        plt.LessThanInteger(OVar("x"), plt.Integer(0)),
+                        plt.LessThanInteger(_VAR_X, _INT_0),
                         plt.ConsByteString(
                             plt.Integer(ord("-")),
                             plt.AppendByteString(
                                 plt.ByteString(b"0o"),
-                                plt.Apply(OVar("mkoct"), plt.Negate(OVar("x"))),
+                                plt.Apply(OVar("mkoct"), plt.Negate(_VAR_X)),
                             ),
                         ),
                         plt.AppendByteString(
                             plt.ByteString(b"0o"),
-                            plt.Apply(OVar("mkoct"), OVar("x")),
+                            plt.Apply(OVar("mkoct"), _VAR_X),
                         ),
                     ),
                 ),
             )
         ),
-    )
-    range = OLambda(
+    ),
+    PythonBuiltIn.range: lambda: OLambda(
         ["limit"],
         plt.Range(OVar("limit")),
-    )
-    reversed = "reversed"
-    sum = OLambda(
+    ),
+    PythonBuiltIn.sum: lambda: OLambda(
         ["xs"],
-        plt.FoldList(
-            OVar("xs"), plt.BuiltIn(uplc.BuiltInFun.AddInteger), plt.Integer(0)
-        ),
-    )
-    isinstance = "isinstance"
+        plt.FoldList(_VAR_XS, plt.BuiltIn(uplc.BuiltInFun.AddInteger), _INT_0),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _python_builtin_impl(b: PythonBuiltIn) -> plt.AST:
+    return PythonBuiltInImpls[b]()
 
 
 PythonBuiltInTypes = {
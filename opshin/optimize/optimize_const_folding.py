@@ -1,10 +1,39 @@
 import typing
-from collections import defaultdict
+from collections import defaultdict, ChainMap
 import logging
+from types import MappingProxyType
 
 from ast import *
 from ordered_set import OrderedSet
 
+# imported explicitly as ast exports a class named operator
+from operator import (
+    add,
+    sub,
+    mul,
+    matmul,
+    truediv,
+    mod,
+    lshift,
+    rshift,
+    or_,
+    xor,
+    and_,
+    floordiv,
+    invert,
+    not_,
+    pos,
+    neg,
+    eq,
+    ne,
+    lt,
+    le,
+    gt,
+    ge,
+    is_,
+    is_not,
+)
+
 from pycardano import PlutusData
 
 try:
@@ -26,71 +55,324 @@ ACCEPTED_ATOMIC_TYPES = [
     type(None),
     bool,
 ]
-
-SAFE_GLOBALS_LIST = [
-    abs,
-    all,
-    any,
-    ascii,
-    bin,
-    bool,
-    bytes,
-    bytearray,
-    callable,
-    chr,
-    classmethod,
-    compile,
-    complex,
-    delattr,
-    dict,
-    dir,
-    divmod,
-    enumerate,
-    filter,
-    float,
-    format,
-    frozenset,
-    getattr,
-    hasattr,
-    hash,
-    hex,
-    id,
-    input,
-    int,
-    isinstance,
-    issubclass,
-    iter,
-    len,
-    list,
-    map,
-    max,
-    min,
-    next,
-    object,
-    oct,
-    open,
-    ord,
-    pow,
-    print,
-    property,
-    range,
-    repr,
-    reversed,
-    round,
-    set,
-    setattr,
-    slice,
-    sorted,
-    staticmethod,
-    str,
-    sum,
-    super,
-    tuple,
-    type,
-    vars,
-    zip,
-]
-SAFE_GLOBALS = {x.__name__: x for x in SAFE_GLOBALS_LIST}
+# all types of values that may be inserted into the AST as constants
+ACCEPTED_TYPES = tuple(ACCEPTED_ATOMIC_TYPES) + (list, dict, PlutusData)
+
+SAFE_GLOBALS = MappingProxyType(
+    {
+        "abs": abs,
+        "all": all,
+        "any": any,
+        "ascii": ascii,
+        "bin": bin,
+        "bool": bool,
+        "bytes": bytes,
+        "bytearray": bytearray,
+        "callable": callable,
+        "chr": chr,
+        "classmethod": classmethod,
+        "compile": compile,
+        "complex": complex,
+        "delattr": delattr,
+        "dict": dict,
+        "dir": dir,
+        "divmod": divmod,
+        "enumerate": enumerate,
+        "filter": filter,
+        "float": float,
+        "format": format,
+        "frozenset": frozenset,
+        "getattr": getattr,
+        "hasattr": hasattr,
+        "hash": hash,
+        "hex": hex,
+        "id": id,
+        "input": input,
+        "int": int,
+        "isinstance": isinstance,
+        "issubclass": issubclass,
+        "iter": iter,
+        "len": len,
+        "list": list,
+        "map": map,
+        "max": max,
+        "min": min,
+        "next": next,
+        "object": object,
+        "oct": oct,
+        "open": open,
+        "ord": ord,
+        "pow": pow,
+        "print": print,
+        "property": property,
+        "range": range,
+        "repr": repr,
+        "reversed": reversed,
+        "round": round,
+        "set": set,
+        "setattr": setattr,
+        "slice": slice,
+        "sorted": sorted,
+        "staticmethod": staticmethod,
+        "str": str,
+        "sum": sum,
+        "super": super,
+        "tuple": tuple,
+        "type": type,
+        "vars": vars,
+        "zip": zip,
+    }
+)
+SAFE_GLOBALS_LIST = list(SAFE_GLOBALS.values())
+# names that are visible initially, the builtins among them are not considered overwritten
+INITIAL_MINUS_SAFE = frozenset(INITIAL_SCOPE.keys()) - frozenset(SAFE_GLOBALS.keys())
+
+BINOP_SYMBOLS = {
+    Add: "+",
+    Sub: "-",
+    Mult: "*",
+    MatMult: "@",
+    Div: "/",
+    Mod: "%",
+    Pow: "**",
+    LShift: "<<",
+    RShift: ">>",
+    BitOr: "|",
+    BitXor: "^",
+    BitAnd: "&",
+    FloorDiv: "//",
+}
+UNARYOP_SYMBOLS = {Invert: "~", Not: "not ", UAdd: "+", USub: "-"}
+BOOLOP_SYMBOLS = {And: " and ", Or: " or "}
+CMPOP_SYMBOLS = {
+    Eq: " == ",
+    NotEq: " != ",
+    Lt: " < ",
+    LtE: " <= ",
+    Gt: " > ",
+    GtE: " >= ",
+    Is: " is ",
+    IsNot: " is not ",
+    In: " in ",
+    NotIn: " not in ",
+}
+
+
+BINOP_FUNCTIONS = {
+    Add: add,
+    Sub: sub,
+    Mult: mul,
+    MatMult: matmul,
+    Div: truediv,
+    Mod: mod,
+    Pow: pow,
+    LShift: lshift,
+    RShift: rshift,
+    BitOr: or_,
+    BitXor: xor,
+    BitAnd: and_,
+    FloorDiv: floordiv,
+}
+UNARYOP_FUNCTIONS = {
+    Invert: invert,
+    Not: not_,
+    UAdd: pos,
+    USub: neg,
+}
+CMPOP_FUNCTIONS = {
+    Eq: eq,
+    NotEq: ne,
+    Lt: lt,
+    LtE: le,
+    Gt: gt,
+    GtE: ge,
+    Is: is_,
+    IsNot: is_not,
+    In: lambda x, y: x in y,
+    NotIn: lambda x, y: x not in y,
+}
+# builtins without side effects that may be called directly when folding
+PURE_BUILTINS = {
+    "abs",
+    "all",
+    "any",
+    "ascii",
+    "bin",
+    "bool",
+    "bytes",
+    "chr",
+    "dict",
+    "divmod",
+    "hex",
+    "int",
+    "len",
+    "list",
+    "max",
+    "min",
+    "oct",
+    "ord",
+    "pow",
+    "range",
+    "repr",
+    "round",
+    "sorted",
+    "str",
+    "sum",
+    "tuple",
+}
+
+# expressions that may evaluate successfully even if some of their children can not be evaluated on their own
+# (because of short-circuiting or because they bind variables themselves)
+LAZY_EXPRESSIONS = (BoolOp, IfExp, Lambda, ListComp, SetComp, DictComp, GeneratorExp)
+# expressions that are only valid as part of their parent expression and can not be evaluated on their own
+PARTIAL_EXPRESSIONS = (Slice, Starred, FormattedValue)
+
+# returned by _try_fold_ast if the expression can not be evaluated without eval
+_NOT_FOLDABLE = object()
+
+
+def _fold_constant(node: Constant, consts: typing.Mapping[str, typing.Any]):
+    return node.value
+
+
+def _fold_name(node: Name, consts: typing.Mapping[str, typing.Any]):
+    return consts.get(node.id, _NOT_FOLDABLE)
+
+
+def _fold_binop(node: BinOp, consts: typing.Mapping[str, typing.Any]):
+    left = _try_fold_ast(node.left, consts)
+    if left is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    right = _try_fold_ast(node.right, consts)
+    if right is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    return BINOP_FUNCTIONS[type(node.op)](left, right)
+
+
+def _fold_unaryop(node: UnaryOp, consts: typing.Mapping[str, typing.Any]):
+    operand = _try_fold_ast(node.operand, consts)
+    if operand is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    return UNARYOP_FUNCTIONS[type(node.op)](operand)
+
+
+def _fold_boolop(node: BoolOp, consts: typing.Mapping[str, typing.Any]):
+    # short-circuits exactly like python does
+    is_and = isinstance(node.op, And)
+    for v in node.values:
+        value = _try_fold_ast(v, consts)
+        if value is _NOT_FOLDABLE:
+            return _NOT_FOLDABLE
+        if bool(value) != is_and:
+            return value
+    return value
+
+
+def _fold_compare(node: Compare, consts: typing.Mapping[str, typing.Any]):
+    left = _try_fold_ast(node.left, consts)
+    if left is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    res = True
+    for op, c in zip(node.ops, node.comparators):
+        right = _try_fold_ast(c, consts)
+        if right is _NOT_FOLDABLE:
+            return _NOT_FOLDABLE
+        res = CMPOP_FUNCTIONS[type(op)](left, right)
+        if not res:
+            return res
+        left = right
+    return res
+
+
+def _fold_elts(elts: typing.List[expr], consts: typing.Mapping[str, typing.Any]):
+    values = []
+    for e in elts:
+        if isinstance(e, Starred):
+            return _NOT_FOLDABLE
+        value = _try_fold_ast(e, consts)
+        if value is _NOT_FOLDABLE:
+            return _NOT_FOLDABLE
+        values.append(value)
+    return values
+
+
+def _fold_tuple(node: Tuple, consts: typing.Mapping[str, typing.Any]):
+    values = _fold_elts(node.elts, consts)
+    if values is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    return tuple(values)
+
+
+def _fold_list(node: List, consts: typing.Mapping[str, typing.Any]):
+    return _fold_elts(node.elts, consts)
+
+
+def _fold_dict(node: Dict, consts: typing.Mapping[str, typing.Any]):
+    if any(k is None for k in node.keys):
+        # dictionary unpacking
+        return _NOT_FOLDABLE
+    keys = _fold_elts(node.keys, consts)
+    if keys is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    values = _fold_elts(node.values, consts)
+    if values is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    return dict(zip(keys, values))
+
+
+def _fold_call(node: Call, consts: typing.Mapping[str, typing.Any]):
+    if not (isinstance(node.func, Name) and node.func.id in PURE_BUILTINS):
+        return _NOT_FOLDABLE
+    func = consts.get(node.func.id)
+    if func is not SAFE_GLOBALS[node.func.id]:
+        # the builtin was overwritten
+        return _NOT_FOLDABLE
+    args = _fold_elts(node.args, consts)
+    if args is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    if any(k.arg is None for k in node.keywords):
+        # keyword unpacking
+        return _NOT_FOLDABLE
+    kwargs = _fold_elts([k.value for k in node.keywords], consts)
+    if kwargs is _NOT_FOLDABLE:
+        return _NOT_FOLDABLE
+    return func(*args, **{k.arg: v for k, v in zip(node.keywords, kwargs)})
+
+
+FOLD_FUNCTIONS = {
+    Constant: _fold_constant,
+    Name: _fold_name,
+    BinOp: _fold_binop,
+    UnaryOp: _fold_unaryop,
+    BoolOp: _fold_boolop,
+    Compare: _fold_compare,
+    Tuple: _fold_tuple,
+    List: _fold_list,
+    Dict: _fold_dict,
+    Call: _fold_call,
+}
+
+
+def _try_fold_ast(node: expr, consts: typing.Mapping[str, typing.Any]):
+    """
+    Evaluates simple expressions directly on the AST, without going through eval.
+    Returns _NOT_FOLDABLE if the expression is not covered, exceptions during evaluation are propagated.
+    """
+    fold = FOLD_FUNCTIONS.get(type(node))
+    if fold is None:
+        return _NOT_FOLDABLE
+    return fold(node, consts)
+
+
+def _exec_node(node: stmt, g: dict, l: dict):
+    """Executes the statement without the detour of unparsing it to source code"""
+    module = fix_missing_locations(Module(body=[node], type_ignores=[]))
+    try:
+        code = compile(module, "<constant folding>", "exec")
+    except (TypeError, ValueError):
+        # constants that were folded into the statement may not be compilable (i.e. lists)
+        code = unparse(node)
+    exec(code, g, l)
 
 
 class ShallowNameDefCollector(CompilingNodeVisitor):
@@ -112,29 +394,32 @@ class ShallowNameDefCollector(CompilingNodeVisitor):
         # ignore the recursive stuff
 
 
-class DefinedTimesVisitor(CompilingNodeVisitor):
-    step = "Collecting how often variables are written"
+class CombinedDefCollector(CompilingNodeVisitor):
+    step = "Collecting occuring variable names and how often they are written"
 
     def __init__(self):
-        self.vars = defaultdict(int)
+        # names defined in the visited scope, i.e. not inside function definitions
+        self.vars = OrderedSet()
+        # how often each name is written, including inside function definitions
+        self.counts = defaultdict(int)
+        self._function_depth = 0
+
+    def add_def(self, name: str):
+        if self._function_depth == 0:
+            self.vars.add(name)
+        self.counts[name] += 1
 
     def visit_For(self, node: For) -> None:
+        # TODO future items: use this together with guaranteed available
         # visit twice to have all names bumped to min 2 assignments
         self.generic_visit(node)
         self.generic_visit(node)
-        return
-        # TODO future items: use this together with guaranteed available
-        # visit twice to have this name bumped to min 2 assignments
-        self.visit(node.target)
-        # visit the whole function
-        self.generic_visit(node)
 
     def visit_While(self, node: While) -> None:
+        # TODO future items: use this together with guaranteed available
         # visit twice to have all names bumped to min 2 assignments
         self.generic_visit(node)
         self.generic_visit(node)
-        return
-        # TODO future items: use this together with guaranteed available
 
     def visit_If(self, node: If) -> None:
         # TODO future items: use this together with guaranteed available
@@ -144,123 +429,149 @@ class DefinedTimesVisitor(CompilingNodeVisitor):
 
     def visit_Name(self, node: Name) -> None:
         if isinstance(node.ctx, Store):
-            self.vars[node.id] += 1
+            self.add_def(node.id)
 
     def visit_ClassDef(self, node: ClassDef):
-        self.vars[node.name] += 1
+        self.add_def(node.name)
         # ignore the content (i.e. attribute names) of class definitions
 
     def visit_FunctionDef(self, node: FunctionDef):
-        self.vars[node.name] += 1
+        self.add_def(node.name)
         # visit arguments twice, they are generally assigned more than once
         for arg in node.args.args:
-            self.vars[arg.arg] += 2
+            self.counts[arg.arg] += 2
+        self._function_depth += 1
         self.generic_visit(node)
+        self._function_depth -= 1
 
     def visit_Import(self, node: Import):
         for n in node.names:
-            self.vars[n] += 1
+            self.counts[n] += 1
 
     def visit_ImportFrom(self, node: ImportFrom):
         for n in node.names:
-            self.vars[n] += 1
+            self.counts[n] += 1
 
 
 class OptimizeConstantFolding(CompilingNodeTransformer):
     step = "Constant folding"
 
     def __init__(self):
-        self.scopes_visible = [
-            OrderedSet(INITIAL_SCOPE.keys()).difference(SAFE_GLOBALS.keys())
-        ]
-        self.scopes_constants = [dict()]
+        # visible variables and constants of all scopes in one stack each,
+        # the marks hold the offset at which each nested scope starts
+        self._flat_visible: typing.List[str] = list(INITIAL_MINUS_SAFE)
+        self._visible_marks: typing.List[int] = []
+        self._flat_constants: typing.List[typing.Tuple[str, typing.Any]] = []
+        self._constant_marks: typing.List[int] = []
+        # number of times each variable was made visible in the open scopes
+        self._visible_counts: typing.Dict[str, int] = {v: 1 for v in self._flat_visible}
         self.constants = OrderedSet()
+        # source code and print usage of visited expressions, keyed by id(node)
+        self._unparsed: typing.Dict[int, str] = {}
+        self._contains_print: typing.Dict[int, bool] = {}
+        # whether the expression (or all children of other nodes) could be evaluated, keyed by id(node)
+        self._foldable: typing.Dict[int, bool] = {}
+        # cached results of _non_overwritten_globals and _constant_vars, reset whenever the scopes change
+        self._globals_cache = None
+        self._constants_cache = None
 
     def enter_scope(self):
-        self.scopes_visible.append(OrderedSet())
-        self.scopes_constants.append(dict())
+        self._visible_marks.append(len(self._flat_visible))
+        self._constant_marks.append(len(self._flat_constants))
+        self._globals_cache = None
+        self._constants_cache = None
 
     def add_var_visible(self, var: str):
-        self.scopes_visible[-1].add(var)
+        self._flat_visible.append(var)
+        self._visible_counts[var] = self._visible_counts.get(var, 0) + 1
+        self._globals_cache = None
 
     def add_vars_visible(self, var: typing.Iterable[str]):
-        self.scopes_visible[-1].update(var)
+        for v in var:
+            self.add_var_visible(v)
 
     def add_constant(self, var: str, value: typing.Any):
-        self.scopes_constants[-1][var] = value
+        self._flat_constants.append((var, value))
+        self._constants_cache = None
 
     def visible_vars(self):
-        res_set = OrderedSet()
-        for s in self.scopes_visible:
-            res_set.update(s)
-        return res_set
+        return self._visible_counts.keys()
 
     def _constant_vars(self):
-        res_d = {}
-        for s in self.scopes_constants:
-            res_d.update(s)
-        return res_d
+        """Returns the constants visible in the current scope. Do not modify the result."""
+        if self._constants_cache is None:
+            # later definitions shadow earlier ones
+            self._constants_cache = dict(self._flat_constants)
+        return self._constants_cache
 
     def exit_scope(self):
-        self.scopes_visible.pop(-1)
-        self.scopes_constants.pop(-1)
+        visible_mark = self._visible_marks.pop()
+        for var in self._flat_visible[visible_mark:]:
+            self._visible_counts[var] -= 1
+            if self._visible_counts[var] == 0:
+                del self._visible_counts[var]
+        del self._flat_visible[visible_mark:]
+        del self._flat_constants[self._constant_marks.pop() :]
+        self._globals_cache = None
+        self._constants_cache = None
 
     def _non_overwritten_globals(self):
+        """Returns the builtins that were not overwritten in the current scope. Do not modify the result."""
+        if self._globals_cache is not None:
+            return self._globals_cache
         overwritten_vars = self.visible_vars()
 
         def err():
             raise ValueError("Was overwritten!")
 
-        non_overwritten_globals = {
-            k: (v if k not in overwritten_vars else err)
-            for k, v in SAFE_GLOBALS.items()
-        }
+        non_overwritten_globals = SAFE_GLOBALS.copy()
+        for k in SAFE_GLOBALS.keys() & overwritten_vars:
+            non_overwritten_globals[k] = err
+        self._globals_cache = non_overwritten_globals
         return non_overwritten_globals
 
     def update_constants(self, node):
-        a = self._non_overwritten_globals()
-        a.update(self._constant_vars())
-        g = a
+        g = dict(self._non_overwritten_globals())
+        g.update(self._constant_vars())
         l = {}
         try:
-            exec(unparse(node), g, l)
+            _exec_node(node, g, l)
         except Exception as e:
             OPSHIN_LOGGER.debug(e)
         else:
             # the class is defined and added to the globals
-            self.scopes_constants[-1].update(l)
+            for k, v in l.items():
+                self.add_constant(k, v)
 
     def visit_Module(self, node: Module) -> Module:
         self.enter_scope()
-        def_vars_collector = ShallowNameDefCollector()
-        def_vars_collector.visit(node)
-        def_vars = def_vars_collector.vars
-        self.add_vars_visible(def_vars)
-
-        constant_collector = DefinedTimesVisitor()
-        constant_collector.visit(node)
-        constants = constant_collector.vars
+        def_collector = CombinedDefCollector()
+        def_collector.visit(node)
+        self.add_vars_visible(def_collector.vars)
         # if it is only assigned exactly once, it must be a constant (due to immutability)
-        self.constants = {c for c, i in constants.items() if i == 1}
+        self.constants = {c for c, i in def_collector.counts.items() if i == 1}
 
         res = self.generic_visit(node)
         self.exit_scope()
+        # the ids of visited nodes may be reused once the original nodes are freed
+        self._unparsed.clear()
+        self._contains_print.clear()
+        self._foldable.clear()
         return res
 
     def visit_FunctionDef(self, node: FunctionDef) -> FunctionDef:
         self.add_var_visible(node.name)
         if node.name in self.constants:
-            a = self._non_overwritten_globals()
-            a.update(self._constant_vars())
-            g = a
+            g = dict(self._non_overwritten_globals())
+            g.update(self._constant_vars())
             try:
                 # we need to pass the global dict as local dict here to make closures possible (rec functions)
-                exec(unparse(node), g, g)
+                _exec_node(node, g, g)
             except Exception as e:
                 OPSHIN_LOGGER.debug(e)
             else:
                 # the class is defined and added to the globals
-                self.scopes_constants[-1][node.name] = g[node.name]
+                self.add_constant(node.name, g[node.name])
 
         self.enter_scope()
         self.add_vars_visible(arg.arg for arg in node.args.args)
@@ -296,9 +607,13 @@ class OptimizeConstantFolding(CompilingNodeTransformer):
         if not isinstance(target, Name):
             return node
 
-        if target.id in self.constants:
-            self.update_constants(node)
         node.value = self.visit(node.value)
+        if target.id in self.constants:
+            if isinstance(node.value, Constant):
+                # the value was already evaluated while visiting it
+                self.add_constant(target.id, node.value.value)
+            elif self._foldable.get(id(node.value), False):
+                self.update_constants(node)
         return node
 
     def visit_AnnAssign(self, node: AnnAssign):
@@ -306,41 +621,110 @@ class OptimizeConstantFolding(CompilingNodeTransformer):
         if not isinstance(target, Name):
             return node
 
-        if target.id in self.constants:
-            self.update_constants(node)
         node.value = self.visit(node.value)
+        # the annotation is evaluated as well, so the assignment needs to be executed
+        if target.id in self.constants and self._foldable.get(id(node.value), False):
+            self.update_constants(node)
         return node
 
+    def _child_source(self, node: expr) -> str:
+        source = self._unparsed.get(id(node))
+        if source is None:
+            source = unparse(node)
+        return source
+
+    def _source(self, node: expr) -> str:
+        """
+        Returns the source code of the expression.
+        Operators are composed from the cached source of their (already visited) children
+        instead of unparsing the whole subtree again.
+        """
+        child = self._child_source
+        if isinstance(node, BinOp):
+            return f"({child(node.left)}){BINOP_SYMBOLS[type(node.op)]}({child(node.right)})"
+        if isinstance(node, UnaryOp):
+            return f"{UNARYOP_SYMBOLS[type(node.op)]}({child(node.operand)})"
+        if isinstance(node, BoolOp):
+            return BOOLOP_SYMBOLS[type(node.op)].join(
+                f"({child(v)})" for v in node.values
+            )
+        if isinstance(node, Compare):
+            return f"({child(node.left)})" + "".join(
+                f"{CMPOP_SYMBOLS[type(op)]}({child(c)})"
+                for op, c in zip(node.ops, node.comparators)
+            )
+        return unparse(node)
+
     def generic_visit(self, node: AST):
         node = super().generic_visit(node)
-        if not isinstance(node, expr):
+        node_id = id(node)
+        # the children have been visited before, so whether they contain print calls
+        # and whether they could be evaluated is known
+        contains_print = (
+            isinstance(node, Call)
+            and isinstance(node.func, Name)
+            and node.func.id == "print"
+        ) or any(self._contains_print.get(id(c), False) for c in iter_child_nodes(node))
+        self._contains_print[node_id] = contains_print
+        children_foldable = all(
+            self._foldable.get(id(c), False) for c in iter_child_nodes(node)
+        )
+        # the source is only recorded when it is computed below, drop outdated entries
+        self._unparsed.pop(node_id, None)
+        self._foldable[node_id] = False
+        if not isinstance(node, expr) or isinstance(node, PARTIAL_EXPRESSIONS):
             # only evaluate expressions, not statements
+            self._foldable[node_id] = children_foldable
             return node
         if isinstance(node, Constant):
             # prevents unneccessary computations
+            self._foldable[node_id] = True
             return node
-        try:
-            node_source = unparse(node)
-        except Exception as e:
-            OPSHIN_LOGGER.debug("Error when trying to unparse node: %s", e)
-            return node
-        if "print(" in node_source:
+        if contains_print:
             # do not optimize away print statements
             return node
+        # we add preceding constant plutusdata definitions here!
+        g = self._non_overwritten_globals()
+        l = self._constant_vars()
+        if isinstance(node, Name):
+            if not (node.id in l or node.id in g):
+                return node
+        elif not (children_foldable or isinstance(node, LAZY_EXPRESSIONS)):
+            # evaluating the children already failed, so evaluating this node will fail as well
+            return node
+        node_source = None
         try:
-            # we add preceding constant plutusdata definitions here!
-            g = self._non_overwritten_globals()
-            l = self._constant_vars()
-            node_eval = eval(node_source, g, l)
+            if (
+                isinstance(node, BinOp)
+                and isinstance(node.left, Constant)
+                and isinstance(node.right, Constant)
+            ):
+                # the most common case (integer arithmetic, concatenation of bytes)
+                node_eval = BINOP_FUNCTIONS[type(node.op)](
+                    node.left.value, node.right.value
+                )
+            else:
+                node_eval = _try_fold_ast(node, ChainMap(l, g))
+            if node_eval is _NOT_FOLDABLE:
+                node_source = self._source(node)
+                # the read-only view prevents the evaluation from altering the cached constants
+                node_eval = eval(node_source, g, MappingProxyType(l))
         except Exception as e:
             OPSHIN_LOGGER.debug("Error trying to evaluate node: %s", e)
             return node
+        self._foldable[node_id] = True
+        if node_source is not None:
+            self._unparsed[node_id] = node_source
 
-        if any(
-            isinstance(node_eval, t)
-            for t in ACCEPTED_ATOMIC_TYPES + [list, dict, PlutusData]
-        ) and not (node_eval == [] or node_eval == {}):
+        if isinstance(node_eval, ACCEPTED_TYPES) and not (
+            node_eval == [] or node_eval == {}
+        ):
             new_node = Constant(node_eval, None)
             copy_location(new_node, node)
+            self._contains_print[id(new_node)] = False
+            self._foldable[id(new_node)] = True
+            self._unparsed.pop(id(new_node), None)
+            if node_source is not None:
+                self._unparsed[id(new_node)] = node_source
             return new_node
         return node
@@ -18,13 +18,13 @@ class RewriteInjectBuiltins(CompilingNodeTransformer):
         additional_assigns = []
         for b in PythonBuiltIn:
             typ = PythonBuiltInTypes[b]
-            if not isinstance(b.value, plt.AST):
+            if isinstance(typ.typ, PolymorphicFunctionType):
                 # skip polymorphic functions
                 continue
             additional_assigns.append(
                 TypedAssign(
                     targets=[TypedName(id=b.name, typ=typ, ctx=Store())],
-                    value=RawPlutoExpr(typ=typ, expr=force_params(deepcopy(b.value))),
+                    value=RawPlutoExpr(typ=typ, expr=force_params(deepcopy(b.impl()))),
                 )
             )
         md = copy(node)
@@ -1,6 +1,7 @@
 from _ast import Name, Store, ClassDef, FunctionDef, Load
 from collections import defaultdict
 from copy import copy, deepcopy
+from functools import lru_cache
 import logging
 
 import typing
@@ -55,15 +56,31 @@ def distinct(xs: list):
     return len(xs) == len(set(xs))
 
 
+@lru_cache(maxsize=None)
+def visitor_method_name(node_type: typing.Type[ast.AST]) -> str:
+    """Returns the name of the visitor method for the node type, typed nodes are visited like their untyped counterpart"""
+    node_class_name = node_type.__name__
+    if node_class_name.startswith("Typed"):
+        node_class_name = node_class_name[len("Typed") :]
+    return "visit_" + node_class_name
+
+
+def cached_visitor(visitor: ast.NodeVisitor, node_type: typing.Type[ast.AST]):
+    """Returns the bound visitor method for the node type, cached per visitor instance"""
+    # subclasses usually do not call super().__init__, so the cache is created on first use
+    cache = visitor.__dict__.setdefault("_visit_cache", {})
+    method = cache.get(node_type)
+    if method is None:
+        method = getattr(visitor, visitor_method_name(node_type), visitor.generic_visit)
+        cache[node_type] = method
+    return method
+
+
 class TypedNodeTransformer(ast.NodeTransformer):
     def visit(self, node):
         """Visit a node."""
         OPSHIN_LOG_CONTEXT_FILTER.node = node
-        node_class_name = node.__class__.__name__
-        if node_class_name.startswith("Typed"):
-            node_class_name = node_class_name[len("Typed") :]
-        method = "visit_" + node_class_name
-        visitor = getattr(self, method, self.generic_visit)
+        visitor = getattr(self, visitor_method_name(type(node)), self.generic_visit)
         return visitor(node)
 
 
@@ -71,20 +88,20 @@ class TypedNodeVisitor(ast.NodeVisitor):
     def visit(self, node):
         """Visit a node."""
         OPSHIN_LOG_CONTEXT_FILTER.node = node
-        node_class_name = node.__class__.__name__
-        if node_class_name.startswith("Typed"):
-            node_class_name = node_class_name[len("Typed") :]
-        method = "visit_" + node_class_name
-        visitor = getattr(self, method, self.generic_visit)
+        visitor = getattr(self, visitor_method_name(type(node)), self.generic_visit)
         return visitor(node)
 
 
 class CompilerError(Exception):
     def __init__(self, orig_err: Exception, node: ast.AST, compilation_step: str):
+        super().__init__(orig_err, node, compilation_step)
         self.orig_err = orig_err
         self.node = node
         self.compilation_step = compilation_step
 
+    def __str__(self):
+        return f"{self.compilation_step}: {self.orig_err.__class__.__name__}: {self.orig_err}"
+
 
 class CompilingNodeTransformer(TypedNodeTransformer):
     step = "Node transformation"
@@ -92,7 +109,7 @@ class CompilingNodeTransformer(TypedNodeTransformer):
     def visit(self, node):
         OPSHIN_LOG_CONTEXT_FILTER.node = node
         try:
-            return super().visit(node)
+            return cached_visitor(self, type(node))(node)
         except Exception as e:
             if isinstance(e, CompilerError):
                 raise e
@@ -109,32 +126,57 @@ class CompilingNodeVisitor(TypedNodeVisitor):
     step = "Node visiting"
 
     def visit(self, node):
+        OPSHIN_LOG_CONTEXT_FILTER.node = node
         try:
-            return super().visit(node)
+            return cached_visitor(self, type(node))(node)
         except Exception as e:
             if isinstance(e, CompilerError):
                 raise e
             raise CompilerError(e, node, self.step)
 
 
+def _bytes_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
+    return uplc.PlutusByteString(bytes.fromhex(j["bytes"]))
+
+
+def _int_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
+    return uplc.PlutusInteger(int(j["int"]))
+
+
+def _list_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
+    return uplc.PlutusList(frozenlist([data_from_json(x) for x in j["list"]]))
+
+
+def _map_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
+    return uplc.PlutusMap(
+        frozendict({data_from_json(d["k"]): data_from_json(d["v"]) for d in j["map"]})
+    )
+
+
+def _constr_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
+    if not ("constructor" in j and "fields" in j):
+        raise NotImplementedError(f"Unknown datum representation {j}")
+    return uplc.PlutusConstr(
+        j["constructor"], frozenlist([data_from_json(x) for x in j["fields"]])
+    )
+
+
+# the representation is determined by the (first) key of the json object
+_DATA_FROM_JSON_HANDLERS = {
+    "bytes": _bytes_from_json,
+    "int": _int_from_json,
+    "list": _list_from_json,
+    "map": _map_from_json,
+    "constructor": _constr_from_json,
+    "fields": _constr_from_json,
+}
+
+
 def data_from_json(j: typing.Dict[str, typing.Any]) -> uplc.PlutusData:
-    if "bytes" in j:
-        return uplc.PlutusByteString(bytes.fromhex(j["bytes"]))
-    if "int" in j:
-        return uplc.PlutusInteger(int(j["int"]))
-    if "list" in j:
-        return uplc.PlutusList(frozenlist(list(map(data_from_json, j["list"]))))
-    if "map" in j:
-        return uplc.PlutusMap(
-            frozendict(
-                {data_from_json(d["k"]): data_from_json(d["v"]) for d in j["map"]}
-            )
-        )
-    if "constructor" in j and "fields" in j:
-        return uplc.PlutusConstr(
-            j["constructor"], frozenlist(list(map(data_from_json, j["fields"])))
-        )
-    raise NotImplementedError(f"Unknown datum representation {j}")
+    handler = _DATA_FROM_JSON_HANDLERS.get(next(iter(j), None))
+    if handler is None:
+        raise NotImplementedError(f"Unknown datum representation {j}")
+    return handler(j)
 
 
 def datum_to_cbor(d: pycardano.Datum) -> bytes:
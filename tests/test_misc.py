@@ -1339,6 +1339,28 @@ def validator(_: None) -> int:
         code_src = code.dumps()
         self.assertIn(f"(con integer {2**10})", code_src)
 
+    def test_constant_folding_builtins_compare(self):
+        source_code = """
+from opshin.prelude import *
+
+def validator(_: None) -> int:
+    return len([1, 2]) + abs(-3) if 1 < 2 < 3 and 4 in [4] else 0
+"""
+        code = builder._compile(source_code, config=DEFAULT_CONFIG_CONSTANT_FOLDING)
+        code_src = code.dumps()
+        self.assertIn(f"(con integer 5)", code_src)
+
+    def test_constant_folding_slice(self):
+        source_code = """
+from opshin.prelude import *
+
+def validator(x: int) -> bytes:
+    return b"abc"[1:3] + bytes([x])
+"""
+        code = builder._compile(source_code, config=DEFAULT_CONFIG_CONSTANT_FOLDING)
+        code_src = code.dumps()
+        self.assertIn(f"(con bytestring #6263)", code_src)
+
     def test_reassign_builtin(self):
         source_code = """
 b = int
@@ -1384,6 +1406,29 @@ def validator(_: None) -> None:
         code_src = code.dumps()
         self.assertIn(f'(con string "hello")', code_src)
 
+    def test_constant_folding_print_in_string(self):
+        source_code = """
+from opshin.prelude import *
+
+def validator(_: None) -> str:
+    return "print(" + "hello)"
+"""
+        code = builder._compile(source_code, config=DEFAULT_CONFIG_CONSTANT_FOLDING)
+        code_src = code.dumps()
+        self.assertIn(f'(con string "print(hello)")', code_src)
+
+    def test_constant_folding_nested_print(self):
+        source_code = """
+from opshin.prelude import *
+
+def validator(_: None) -> int:
+    return len([print("hello"), print("world")])
+"""
+        code = builder._compile(source_code, config=DEFAULT_CONFIG_CONSTANT_FOLDING)
+        code_src = code.dumps()
+        self.assertIn(f'(con string "hello")', code_src)
+        self.assertIn(f'(con string "world")', code_src)
+
     def test_inner_outer_state_functions(self):
         source_code = """
 a = 2
@@ -3042,3 +3087,19 @@ def validator(a: bool, b:bool)-> int:
 """
         res = eval_uplc_value(source_code, a, b)
         self.assertEquals(res, 5 - (a > b))
+
+    def test_data_from_json(self):
+        from opshin.util import data_from_json
+
+        j = {
+            "constructor": 0,
+            "fields": [
+                {"int": 1},
+                {"bytes": "00ff"},
+                {"list": [{"int": 2}]},
+                {"map": [{"k": {"int": 1}, "v": {"bytes": ""}}]},
+            ],
+        }
+        self.assertEqual(data_from_json(j), uplc.data_from_json_dict(j))
+        with self.assertRaises(NotImplementedError):
+            data_from_json({"constructor": 0})